@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
-from fastapi import Request
+import httpx
+from fastapi import FastAPI, Request
 
 from .gateway import RunGateway
 from .request_context import parse_bearer_token, reset_bearer_token, set_bearer_token
@@ -10,6 +13,10 @@ from .utils import auth_settings_from_env_or_dev_secure
 
 logger = logging.getLogger(__name__)
 
+# Process-wide connection pool for gateway -> coordinator calls, shared by every
+# gateway this module builds and closed on app shutdown.
+_HTTP_TRANSPORT = httpx.AsyncHTTPTransport(retries=2, limits=httpx.Limits(max_connections=500))
+
 
 def create_app():
     auth_settings = auth_settings_from_env_or_dev_secure()
@@ -18,11 +25,22 @@ def create_app():
         getattr(auth_settings, "mode", None),
         getattr(auth_settings, "issuer", None),
     )
-    app = RunGateway().create_app(
+    gateway = RunGateway(http_transport=_HTTP_TRANSPORT)
+    app = gateway.create_app(
         title="JARVIS Run Gateway",
         auth_settings=auth_settings,
     )
 
+    @asynccontextmanager
+    async def _lifespan(_: FastAPI) -> AsyncIterator[None]:
+        try:
+            yield
+        finally:
+            await gateway.aclose()
+            await _HTTP_TRANSPORT.aclose()
+
+    app.router.lifespan_context = _lifespan
+
     @app.middleware("http")
     async def _capture_bearer_token(request: Request, call_next):  # type: ignore[no-untyped-def]
         token_state = set_bearer_token(parse_bearer_token(request.headers.get("Authorization")))
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import inspect
 import logging
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
 
+import httpx
 from arp_standard_model import (
     Check,
     Health,
@@ -10,27 +14,37 @@ from arp_standard_model import (
     RunGatewayGetRunRequest,
     RunGatewayHealthRequest,
     RunGatewayStartRunRequest,
+    RunGatewayStreamRunEventsParams,
     RunGatewayStreamRunEventsRequest,
     RunGatewayVersionRequest,
+    RunStartRequest,
     Status,
     VersionInfo,
 )
-from arp_standard_server import ArpServerError
-from arp_standard_server.run_gateway import BaseRunGatewayServer
+from arp_standard_server import ArpServerError, AuthSettings
+from arp_standard_server.app import build_app
+from arp_standard_server.run_gateway import BaseRunGatewayServer, create_router
+from fastapi import APIRouter, Body, FastAPI, Path, Response
+from fastapi.responses import StreamingResponse
+from fastapi.routing import APIRoute
 
 from . import __version__
 from .request_context import get_bearer_token
 from .run_coordinator_client import RunCoordinatorGatewayClient
 from .utils import (
     auth_client_from_env,
-    now,
+    coarse_now,
     normalize_base_url,
     run_coordinator_audience_from_env,
+    run_coordinator_passthrough_from_env,
+    run_coordinator_sync_client_from_env,
     run_coordinator_url_from_env,
 )
 
 logger = logging.getLogger(__name__)
 
+MAX_BATCH_GET_RUNS = 100
+
 
 class RunGateway(BaseRunGatewayServer):
     """Run lifecycle ingress; add your authN/authZ and proxying here."""
@@ -43,6 +57,8 @@ class RunGateway(BaseRunGatewayServer):
         run_coordinator_url: str | None = None,
         service_name: str = "arp-jarvis-rungateway",
         service_version: str = __version__,
+        http_transport: httpx.AsyncBaseTransport | None = None,
+        passthrough_responses: bool | None = None,
     ) -> None:
         """
         Not part of ARP spec; required to construct the gateway.
@@ -54,6 +70,12 @@ class RunGateway(BaseRunGatewayServer):
             `run_coordinator` is not provided. Defaults from `JARVIS_RUN_COORDINATOR_URL`.
           - service_name: Name exposed by /v1/version.
           - service_version: Version exposed by /v1/version.
+          - http_transport: Optional shared httpx transport for coordinator calls.
+            Used only if `run_coordinator` is not provided; the caller owns and
+            closes it.
+          - passthrough_responses: Return coordinator Run bodies to HTTP clients
+            as raw bytes for start/get/cancel. Defaults from
+            `JARVIS_RUN_COORDINATOR_PASSTHROUGH`.
 
         Potential modifications:
           - Inject your own RunCoordinatorGatewayClient with custom auth.
@@ -62,6 +84,15 @@ class RunGateway(BaseRunGatewayServer):
         """
         self._service_name = service_name
         self._service_version = service_version
+        self._version_info = VersionInfo(
+            service_name=service_name,
+            service_version=service_version,
+            supported_api_versions=["v1"],
+        )
+        self._version_bytes = self._version_info.model_dump_json().encode()
+        if passthrough_responses is None:
+            passthrough_responses = run_coordinator_passthrough_from_env()
+        self._passthrough_responses = passthrough_responses
 
         if run_coordinator is not None:
             self._run_coordinator = run_coordinator
@@ -80,6 +111,8 @@ class RunGateway(BaseRunGatewayServer):
             base_url=resolved_url,
             auth_client=auth_client_from_env(),
             exchange_audience=exchange_audience,
+            sync_client_only=run_coordinator_sync_client_from_env(),
+            http_transport=http_transport,
         )
         logger.info(
             "Run Gateway configured (run_coordinator_url=%s, exchange_audience=%s)",
@@ -98,35 +131,33 @@ class RunGateway(BaseRunGatewayServer):
         Potential modifications:
           - Add checks for downstream dependencies (Run Coordinator, auth, DB).
           - Report degraded status when dependencies fail.
+
+        All fields are server-controlled, so Health/Check use `model_construct`
+        and skip validation.
         """
         _ = request
         if self._run_coordinator is None:
-            return Health(status=Status.ok, time=now())
+            return Health.model_construct(status=Status.ok, time=coarse_now())
 
         try:
             downstream_health = await self._run_coordinator.health()
         except Exception as exc:
-            check = Check(
+            check = Check.model_construct(
                 name="run_coordinator",
                 status=Status.down,
                 message=str(exc),
                 details={"url": self._run_coordinator.base_url},
             )
-            return Health(status=Status.degraded, time=now(), checks=[check])
+            return Health.model_construct(status=Status.degraded, time=coarse_now(), checks=[check])
 
-        check = Check(
+        check = Check.model_construct(
             name="run_coordinator",
             status=downstream_health.status,
             message=None,
-            details={
-                "url": self._run_coordinator.base_url,
-                "status": downstream_health.status,
-            },
+            details={"url": self._run_coordinator.base_url},
         )
-        checks = [check]
-        if downstream_health.checks:
-            checks.extend(downstream_health.checks)
-        return Health(status=downstream_health.status, time=now(), checks=checks)
+        checks = [check, *downstream_health.checks] if downstream_health.checks else [check]
+        return Health.model_construct(status=downstream_health.status, time=coarse_now(), checks=checks)
 
     async def version(self, request: RunGatewayVersionRequest) -> VersionInfo:
         """
@@ -139,11 +170,7 @@ class RunGateway(BaseRunGatewayServer):
           - Include build metadata (git SHA, build time) via VersionInfo.build.
         """
         _ = request
-        return VersionInfo(
-            service_name=self._service_name,
-            service_version=self._service_version,
-            supported_api_versions=["v1"],
-        )
+        return self._version_info
 
     async def start_run(self, request: RunGatewayStartRunRequest) -> Run:
         """
@@ -203,6 +230,36 @@ class RunGateway(BaseRunGatewayServer):
         logger.info("Run fetched (run_id=%s, state=%s)", run.run_id, run.state)
         return run
 
+    async def get_runs(self, run_ids: list[str]) -> list[Run]:
+        """
+        Not part of ARP spec; batch variant of `get_run` served at `POST /v1/runs:batchGet`.
+
+        Args:
+          - run_ids: Run IDs to fetch (at most `MAX_BATCH_GET_RUNS`).
+
+        Potential modifications:
+          - Gate visibility (authZ) per run for multi-tenant environments.
+          - Return per-run errors instead of failing the whole batch.
+        """
+        if len(run_ids) > MAX_BATCH_GET_RUNS:
+            raise ArpServerError(
+                code="invalid_request",
+                message=f"At most {MAX_BATCH_GET_RUNS} run_ids may be fetched per batch",
+                status_code=400,
+                details={"max_run_ids": MAX_BATCH_GET_RUNS, "run_ids": len(run_ids)},
+            )
+        logger.info("Run batch fetch requested (count=%s)", len(run_ids))
+        try:
+            runs = await self._require_coordinator().get_runs(run_ids, subject_token=self._subject_token())
+        except ArpServerError as exc:
+            logger.warning("Run batch fetch failed (%s): %s", exc.code, exc.message)
+            raise
+        except Exception:
+            logger.exception("Run batch fetch failed (count=%s)", len(run_ids))
+            raise
+        logger.info("Runs fetched (count=%s)", len(runs))
+        return runs
+
     async def cancel_run(self, request: RunGatewayCancelRunRequest) -> Run:
         """
         Mandatory: Required by the ARP Run Gateway API.
@@ -254,7 +311,141 @@ class RunGateway(BaseRunGatewayServer):
         logger.info("Run events stream ready (run_id=%s, bytes=%s)", run_id, len(payload))
         return payload
 
+    async def stream_run_event_chunks(self, request: RunGatewayStreamRunEventsRequest) -> AsyncIterator[bytes]:
+        """
+        Not part of ARP spec; incremental variant of `stream_run_events` backing
+        `GET /v1/runs/{run_id}/events`.
+
+        Args:
+          - request: RunGatewayStreamRunEventsRequest with run_id.
+
+        Potential modifications:
+          - Add filtering/redaction per NDJSON line for external consumers.
+        """
+        run_id = request.params.run_id
+        logger.info("Run events stream requested (run_id=%s)", run_id)
+        try:
+            chunks = await self._require_coordinator().stream_run_event_chunks(
+                run_id, subject_token=self._subject_token()
+            )
+        except ArpServerError as exc:
+            logger.warning("Run events stream failed (%s): %s", exc.code, exc.message)
+            raise
+        except Exception:
+            logger.exception("Run events stream failed (run_id=%s)", run_id)
+            raise
+        logger.info("Run events stream opened (run_id=%s)", run_id)
+        return chunks
+
+    def create_app(
+        self,
+        *,
+        title: str | None = None,
+        auth_settings: AuthSettings | None = None,
+    ) -> FastAPI:
+        """
+        Not part of ARP spec; builds the FastAPI app for this gateway.
+
+        `/v1/version` is served from pre-encoded bytes so probes skip
+        response-model validation and JSON encoding. `version()` remains the
+        programmatic API. `/v1/runs/{run_id}/events` streams coordinator NDJSON
+        chunks as they arrive instead of buffering the whole body. Also registers
+        the non-spec `POST /v1/runs:batchGet`.
+
+        With passthrough enabled, start/get/cancel return the coordinator's
+        Run JSON unparsed. Those routes then bypass `start_run`, `get_run` and
+        `cancel_run`, so only enable it when the schemas are known to match and
+        no gateway-side hooks are needed.
+
+        Every route must be `async def`; sync handlers would be dispatched to
+        FastAPI's threadpool, so they are rejected here.
+        """
+        router = create_router(self)
+
+        async def _version() -> Response:
+            return Response(content=self._version_bytes, media_type="application/json")
+
+        async def _stream_run_events(run_id: str = Path(..., alias="run_id")) -> StreamingResponse:
+            request = RunGatewayStreamRunEventsRequest(params=RunGatewayStreamRunEventsParams(run_id=run_id))
+            chunks = await self.stream_run_event_chunks(request)
+            return StreamingResponse(chunks, media_type="application/x-ndjson")
+
+        async def _batch_get_runs(run_ids: list[str] = Body(..., embed=True)) -> list[Run]:
+            return await self.get_runs(run_ids)
+
+        _replace_route(router, "/v1/version", "GET", _version, response_model=VersionInfo)
+        _replace_route(
+            router,
+            "/v1/runs/{run_id}/events",
+            "GET",
+            _stream_run_events,
+            response_class=StreamingResponse,
+            responses={200: {"content": {"application/x-ndjson": {}}}},
+        )
+        if self._passthrough_responses:
+            self._register_passthrough_routes(router)
+        router.add_api_route(
+            "/v1/runs:batchGet",
+            _batch_get_runs,
+            methods=["POST"],
+            response_model=list[Run],
+            status_code=200,
+            name="batch_get_runs",
+        )
+        _require_async_routes(router)
+        return build_app(router=router, title=title or "ARP Run Gateway Server", auth_settings=auth_settings)
+
+    async def aclose(self) -> None:
+        """
+        Not part of ARP spec; releases the outgoing Run Coordinator connection pool.
+
+        Called from the FastAPI lifespan on shutdown (see `app.create_app`).
+        """
+        aclose = getattr(self._run_coordinator, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
     # Helpers (internal): implementation detail for the reference implementation.
+    def _register_passthrough_routes(self, router: APIRouter) -> None:
+        async def _start_run(body: RunStartRequest = Body(...)) -> Response:
+            return await self._forward_json(
+                "start",
+                lambda coordinator, token: coordinator.start_run_json(body, subject_token=token),
+            )
+
+        async def _get_run(run_id: str = Path(..., alias="run_id")) -> Response:
+            return await self._forward_json(
+                "fetch",
+                lambda coordinator, token: coordinator.get_run_json(run_id, subject_token=token),
+            )
+
+        async def _cancel_run(run_id: str = Path(..., alias="run_id")) -> Response:
+            return await self._forward_json(
+                "cancel",
+                lambda coordinator, token: coordinator.cancel_run_json(run_id, subject_token=token),
+            )
+
+        _replace_route(router, "/v1/runs", "POST", _start_run, response_model=Run)
+        _replace_route(router, "/v1/runs/{run_id}", "GET", _get_run, response_model=Run)
+        _replace_route(router, "/v1/runs/{run_id}:cancel", "POST", _cancel_run, response_model=Run)
+
+    async def _forward_json(
+        self,
+        action: str,
+        call: Callable[[RunCoordinatorGatewayClient, str | None], Awaitable[bytes]],
+    ) -> Response:
+        logger.info("Run %s requested (passthrough)", action)
+        try:
+            payload = await call(self._require_coordinator(), self._subject_token())
+        except ArpServerError as exc:
+            logger.warning("Run %s failed (%s): %s", action, exc.code, exc.message)
+            raise
+        except Exception:
+            logger.exception("Run %s failed", action)
+            raise
+        logger.info("Run %s forwarded (bytes=%s)", action, len(payload))
+        return Response(content=payload, media_type="application/json")
+
     def _require_coordinator(self) -> RunCoordinatorGatewayClient:
         if self._run_coordinator is None:
             logger.error("Run Coordinator is not configured for this gateway")
@@ -273,3 +464,24 @@ def _input_key_count(payload: object | None) -> int | None:
     if isinstance(payload, dict):
         return len(payload)
     return None
+
+
+def _replace_route(router: APIRouter, path: str, method: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+    # Edit the SDK router before build_app: FastAPI matches included routers
+    # ahead of routes added to the app afterwards. The replaced route's name and
+    # status code are kept so the published operationId/summary do not change.
+    routes = []
+    for route in router.routes:
+        if isinstance(route, APIRoute) and route.path == path and method in (route.methods or ()):
+            kwargs.setdefault("name", route.name)
+            kwargs.setdefault("status_code", route.status_code)
+            continue
+        routes.append(route)
+    router.routes[:] = routes
+    router.add_api_route(path, endpoint, methods=[method], **kwargs)
+
+
+def _require_async_routes(router: APIRouter) -> None:
+    for route in router.routes:
+        if isinstance(route, APIRoute) and not inspect.iscoroutinefunction(route.endpoint):
+            raise TypeError(f"Route {route.path} must be async; sync handlers run on the threadpool")
@@ -1,13 +1,20 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
+import hashlib
+import inspect
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
 from typing import Any
+from urllib.parse import quote
 
-from arp_auth import AuthClient
+import httpx
+from arp_auth import AuthClient, TokenResponse
 from arp_standard_client.errors import ArpApiError
 from arp_standard_client.run_coordinator import RunCoordinatorClient
 from arp_standard_model import (
+    ErrorEnvelope,
     Health,
     Run,
     RunCoordinatorCancelRunParams,
@@ -21,6 +28,126 @@ from arp_standard_model import (
     RunStartRequest,
 )
 from arp_standard_server import ArpServerError
+from pydantic import TypeAdapter, ValidationError
+
+DEFAULT_HTTP_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=100)
+
+_RUN_ADAPTER = TypeAdapter(Run)
+_HEALTH_ADAPTER = TypeAdapter(Health)
+_ERROR_ENVELOPE_ADAPTER = TypeAdapter(ErrorEnvelope)
+
+# Outbound tokens are reused until shortly before they expire; the cache is
+# bounded because exchanged tokens are keyed per inbound subject token.
+_TOKEN_EXPIRY_SKEW_SECONDS = 30.0
+_TOKEN_CACHE_MAX_ENTRIES = 1024
+
+
+class AsyncRunCoordinatorClient:
+    """Async Run Coordinator client that keeps outgoing calls on the event loop.
+
+    Mirrors the `RunCoordinatorClient` methods used by the gateway, but drives a
+    single pooled `httpx.AsyncClient` instead of dispatching to a worker thread.
+    `with_headers` returns a view that shares the same connection pool.
+
+    Pass `transport` to share one connection pool across clients; a shared
+    transport is left open by `aclose()` and must be closed by its owner.
+    """
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        *,
+        http_client: httpx.AsyncClient | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: httpx.Timeout | None = None,
+        limits: httpx.Limits = DEFAULT_HTTP_LIMITS,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        if http_client is None:
+            if base_url is None:
+                raise ValueError("base_url is required when http_client is not provided")
+            http_client = httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits, transport=transport)
+        self._http_client = http_client
+        self._headers = {} if headers is None else dict(headers)
+        self._owns_transport = transport is None
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        return self._http_client
+
+    def with_headers(self, headers: dict[str, str]) -> AsyncRunCoordinatorClient:
+        view = AsyncRunCoordinatorClient(http_client=self._http_client, headers={**self._headers, **headers})
+        view._owns_transport = self._owns_transport
+        return view
+
+    async def cancel_run(self, request: RunCoordinatorCancelRunRequest) -> Run:
+        return _RUN_ADAPTER.validate_json(await self.cancel_run_json(request))
+
+    async def cancel_run_json(self, request: RunCoordinatorCancelRunRequest) -> bytes:
+        response = await self._http_client.post(
+            f"/v1/runs/{quote(request.params.run_id, safe='')}:cancel",
+            headers=self._headers,
+        )
+        _raise_for_error(response)
+        return response.content
+
+    async def get_run(self, request: RunCoordinatorGetRunRequest) -> Run:
+        return _RUN_ADAPTER.validate_json(await self.get_run_json(request))
+
+    async def get_run_json(self, request: RunCoordinatorGetRunRequest) -> bytes:
+        response = await self._http_client.get(
+            f"/v1/runs/{quote(request.params.run_id, safe='')}",
+            headers=self._headers,
+        )
+        _raise_for_error(response)
+        return response.content
+
+    async def health(self, request: RunCoordinatorHealthRequest) -> Health:
+        _ = request
+        response = await self._http_client.get("/v1/health", headers=self._headers)
+        _raise_for_error(response)
+        return _HEALTH_ADAPTER.validate_json(response.content)
+
+    async def start_run(self, request: RunCoordinatorStartRunRequest) -> Run:
+        return _RUN_ADAPTER.validate_json(await self.start_run_json(request))
+
+    async def start_run_json(self, request: RunCoordinatorStartRunRequest) -> bytes:
+        response = await self._http_client.post(
+            "/v1/runs",
+            json=request.body.model_dump(mode="json", exclude_none=True),
+            headers=self._headers,
+        )
+        _raise_for_error(response)
+        return response.content
+
+    async def stream_run_events(self, request: RunCoordinatorStreamRunEventsRequest) -> str:
+        response = await self._http_client.get(
+            f"/v1/runs/{quote(request.params.run_id, safe='')}/events",
+            headers=self._headers,
+        )
+        _raise_for_error(response)
+        return response.text
+
+    async def open_run_events(self, request: RunCoordinatorStreamRunEventsRequest) -> httpx.Response:
+        """Open the run events stream; the caller must `aclose()` the returned response."""
+        http_request = self._http_client.build_request(
+            "GET",
+            f"/v1/runs/{quote(request.params.run_id, safe='')}/events",
+            headers=self._headers,
+        )
+        response = await self._http_client.send(http_request, stream=True)
+        if response.status_code != 200:
+            try:
+                await response.aread()
+            finally:
+                await response.aclose()
+            _raise_for_error(response)
+        return response
+
+    async def aclose(self) -> None:
+        if self._owns_transport:
+            await self._http_client.aclose()
+
 
 class RunCoordinatorGatewayClient:
     """Outgoing Run Coordinator client wrapper for the Run Gateway.
@@ -29,6 +156,14 @@ class RunCoordinatorGatewayClient:
     - auth token exchange
     - retries/timeouts/circuit breakers
     - header forwarding (correlation IDs, tenant IDs, etc.)
+
+    Coroutine client methods are awaited on the event loop; only sync methods
+    are dispatched via `asyncio.to_thread`. `sync_client_only` skips the default
+    async client and keeps every call on the threaded `RunCoordinatorClient`.
+
+    `AuthClient` is synchronous, so token requests still run via
+    `asyncio.to_thread`; tokens with an `expires_in` are cached until shortly
+    before expiry, so only cache misses pay that thread hop.
     """
 
     # Core method - API surface and main extension points
@@ -41,13 +176,20 @@ class RunCoordinatorGatewayClient:
         exchange_audience: str | None = None,
         exchange_scope: str | None = None,
         client_factory: Callable[[Any], RunCoordinatorClient] | None = None,
+        async_client: AsyncRunCoordinatorClient | None = None,
+        sync_client_only: bool = False,
+        http_transport: httpx.AsyncBaseTransport | None = None,
     ) -> None:
         self.base_url = base_url
+        if async_client is None and client is None and client_factory is None and not sync_client_only:
+            async_client = AsyncRunCoordinatorClient(base_url=base_url, transport=http_transport)
+        self._async_client = async_client
         self._client = client or RunCoordinatorClient(base_url=base_url)
         self._auth_client = auth_client
         self._exchange_audience = exchange_audience
         self._exchange_scope = exchange_scope
         self._client_factory = client_factory or (lambda raw_client: RunCoordinatorClient(client=raw_client))
+        self._token_cache: OrderedDict[bytes | None, tuple[str, float]] = OrderedDict()
 
     # Core methods - outgoing Run Coordinator calls
     async def cancel_run(self, run_id: str, *, subject_token: str | None = None) -> Run:
@@ -64,6 +206,27 @@ class RunCoordinatorGatewayClient:
             subject_token=subject_token,
         )
 
+    async def get_runs(self, run_ids: list[str], *, subject_token: str | None = None) -> list[Run]:
+        """Fetch several runs concurrently over the shared connection pool.
+
+        The outbound token is resolved once for the whole batch. If any fetch
+        fails, the first error (in `run_ids` order) is raised after all calls settle.
+        """
+        fn = await self._method_for("get_run", subject_token)
+        results = await asyncio.gather(
+            *(
+                self._invoke(fn, RunCoordinatorGetRunRequest(params=RunCoordinatorGetRunParams(run_id=run_id)))
+                for run_id in run_ids
+            ),
+            return_exceptions=True,
+        )
+        runs: list[Run] = []
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+            runs.append(result)
+        return runs
+
     async def health(self) -> Health:
         return await self._call(
             "health",
@@ -84,11 +247,69 @@ class RunCoordinatorGatewayClient:
             subject_token=subject_token,
         )
 
+    async def cancel_run_json(self, run_id: str, *, subject_token: str | None = None) -> bytes:
+        return await self._call_json(
+            "cancel_run",
+            RunCoordinatorCancelRunRequest(params=RunCoordinatorCancelRunParams(run_id=run_id)),
+            subject_token=subject_token,
+        )
+
+    async def get_run_json(self, run_id: str, *, subject_token: str | None = None) -> bytes:
+        return await self._call_json(
+            "get_run",
+            RunCoordinatorGetRunRequest(params=RunCoordinatorGetRunParams(run_id=run_id)),
+            subject_token=subject_token,
+        )
+
+    async def start_run_json(self, body: RunStartRequest, *, subject_token: str | None = None) -> bytes:
+        return await self._call_json(
+            "start_run",
+            RunCoordinatorStartRunRequest(body=body),
+            subject_token=subject_token,
+        )
+
+    async def stream_run_event_chunks(
+        self, run_id: str, *, subject_token: str | None = None
+    ) -> AsyncIterator[bytes]:
+        """Open the coordinator event stream and return an iterator over its raw bytes.
+
+        Auth and status errors are raised here, before any byte is yielded, so the
+        caller can still answer with an error envelope. Injected sync clients cannot
+        stream; their buffered payload is yielded as a single chunk.
+        """
+        request = RunCoordinatorStreamRunEventsRequest(params=RunCoordinatorStreamRunEventsParams(run_id=run_id))
+        if self._async_client is None:
+            payload: str = await self._call("stream_run_events", request, subject_token=subject_token)
+            return _iter_chunks([payload.encode()])
+        client = await self._async_client_for(self._async_client, subject_token)
+        response: httpx.Response = await self._invoke(client.open_run_events, request)
+        return _iter_response(response)
+
+    async def aclose(self) -> None:
+        if self._async_client is not None:
+            await self._async_client.aclose()
+
     # Helpers (internal): implementation detail for the reference implementation.
     async def _call(self, method_name: str, request: Any, *, subject_token: str | None = None) -> Any:
-        client = await self._client_for(subject_token)
-        fn: Callable[[Any], Any] = getattr(client, method_name)
+        fn = await self._method_for(method_name, subject_token)
+        return await self._invoke(fn, request)
+
+    async def _call_json(self, method_name: str, request: Any, *, subject_token: str | None = None) -> bytes:
+        # Raw coordinator body, unparsed; injected sync clients only return models.
+        if self._async_client is None:
+            run: Run = await self._call(method_name, request, subject_token=subject_token)
+            return run.model_dump_json().encode()
+        return await self._call(f"{method_name}_json", request, subject_token=subject_token)
+
+    async def _method_for(self, method_name: str, subject_token: str | None) -> Callable[[Any], Any]:
+        if self._async_client is not None:
+            return getattr(await self._async_client_for(self._async_client, subject_token), method_name)
+        return getattr(await self._client_for(subject_token), method_name)
+
+    async def _invoke(self, fn: Callable[[Any], Any], request: Any) -> Any:
         try:
+            if inspect.iscoroutinefunction(fn):
+                return await fn(request)
             return await asyncio.to_thread(fn, request)
         except ArpApiError as exc:
             raise ArpServerError(
@@ -97,6 +318,16 @@ class RunCoordinatorGatewayClient:
                 status_code=exc.status_code or 502,
                 details=exc.details,
             ) from exc
+        except httpx.HTTPStatusError as exc:
+            raise ArpServerError(
+                code="run_coordinator_error",
+                message="Run Coordinator returned an unexpected response",
+                status_code=502,
+                details={
+                    "run_coordinator_url": self.base_url,
+                    "status_code": exc.response.status_code,
+                },
+            ) from exc
         except Exception as exc:
             raise ArpServerError(
                 code="run_coordinator_unavailable",
@@ -113,12 +344,35 @@ class RunCoordinatorGatewayClient:
         raw_client = self._client.raw_client.with_headers({"Authorization": f"Bearer {bearer_token}"})
         return self._client_factory(raw_client)
 
+    async def _async_client_for(
+        self, client: AsyncRunCoordinatorClient, subject_token: str | None
+    ) -> AsyncRunCoordinatorClient:
+        bearer_token = await self._resolve_bearer_token(subject_token)
+        return client.with_headers({"Authorization": f"Bearer {bearer_token}"})
+
     async def _resolve_bearer_token(self, subject_token: str | None) -> str:
+        # Key exchanged tokens by digest so raw subject tokens are not retained.
+        cache_key = hashlib.sha256(subject_token.encode()).digest() if subject_token else None
+        cached = self._token_cache.get(cache_key)
+        if cached is not None:
+            access_token, expires_at = cached
+            if time.monotonic() < expires_at:
+                self._token_cache.move_to_end(cache_key)
+                return access_token
+            del self._token_cache[cache_key]
         if subject_token:
-            return await self._exchange_subject_token(subject_token)
-        return await self._client_credentials_token()
+            token = await self._exchange_subject_token(subject_token)
+        else:
+            token = await self._client_credentials_token()
+        expires_in = getattr(token, "expires_in", None)
+        if expires_in and expires_in > _TOKEN_EXPIRY_SKEW_SECONDS:
+            expires_at = time.monotonic() + expires_in - _TOKEN_EXPIRY_SKEW_SECONDS
+            self._token_cache[cache_key] = (token.access_token, expires_at)
+            if len(self._token_cache) > _TOKEN_CACHE_MAX_ENTRIES:
+                self._token_cache.popitem(last=False)
+        return token.access_token
 
-    async def _exchange_subject_token(self, subject_token: str) -> str:
+    async def _exchange_subject_token(self, subject_token: str) -> TokenResponse:
         try:
             token = await asyncio.to_thread(
                 self._auth_client.exchange_token,
@@ -133,9 +387,9 @@ class RunCoordinatorGatewayClient:
                 status_code=getattr(exc, "status_code", None) or 502,
                 details=self._auth_error_details(exc),
             ) from exc
-        return token.access_token
+        return token
 
-    async def _client_credentials_token(self) -> str:
+    async def _client_credentials_token(self) -> TokenResponse:
         try:
             token = await asyncio.to_thread(
                 self._auth_client.client_credentials,
@@ -149,8 +403,43 @@ class RunCoordinatorGatewayClient:
                 status_code=getattr(exc, "status_code", None) or 502,
                 details=self._auth_error_details(exc),
             ) from exc
-        return token.access_token
+        return token
 
     def _auth_error_details(self, exc: Exception) -> dict[str, Any] | None:
         _ = exc
         return None
+
+
+async def _iter_chunks(chunks: list[bytes]) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+async def _iter_response(response: httpx.Response) -> AsyncIterator[bytes]:
+    try:
+        async for chunk in response.aiter_bytes():
+            yield chunk
+    finally:
+        await response.aclose()
+
+
+def _raise_for_error(response: httpx.Response) -> None:
+    if response.status_code == 200:
+        return
+    try:
+        envelope = _ERROR_ENVELOPE_ADAPTER.validate_json(response.content)
+    except ValidationError:
+        response.raise_for_status()
+        raise ArpApiError(
+            code="unexpected_status",
+            message=f"Run Coordinator returned status {response.status_code}",
+            status_code=response.status_code,
+            raw=response.content,
+        ) from None
+    raise ArpApiError(
+        code=envelope.error.code,
+        message=envelope.error.message,
+        details=envelope.error.details,
+        status_code=response.status_code,
+        raw=envelope.model_dump(mode="json", exclude_none=True),
+    )
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import functools
 import os
+import time
 from datetime import datetime, timezone
 
 from arp_auth import AuthClient, AuthError
@@ -9,12 +11,31 @@ from arp_standard_server import AuthSettings
 DEFAULT_DEV_KEYCLOAK_ISSUER = "http://localhost:8080/realms/arp-dev"
 
 
+COARSE_NOW_RESOLUTION_SECONDS = 0.001
+
+_coarse_now: tuple[float, datetime] | None = None
+
+
 def now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def coarse_now() -> datetime:
+    # Shares one timestamp across calls within COARSE_NOW_RESOLUTION_SECONDS.
+    # Use for informational timestamps (health probes), not run lifecycle fields.
+    global _coarse_now
+    tick = time.monotonic()
+    cached = _coarse_now
+    if cached is not None and tick - cached[0] < COARSE_NOW_RESOLUTION_SECONDS:
+        return cached[1]
+    value = datetime.now(timezone.utc)
+    _coarse_now = (tick, value)
+    return value
+
+
+@functools.lru_cache(maxsize=128)
 def normalize_base_url(url: str) -> str:
-    normalized = url.rstrip("/")
+    normalized = url.rstrip("/") if url.endswith("/") else url
     if normalized.endswith("/v1"):
         normalized = normalized[:-3]
     return normalized
@@ -27,6 +48,18 @@ def run_coordinator_url_from_env() -> str | None:
     return normalize_base_url(url)
 
 
+def run_coordinator_sync_client_from_env() -> bool:
+    return _flag_from_env("JARVIS_RUN_COORDINATOR_SYNC_CLIENT")
+
+
+def run_coordinator_passthrough_from_env() -> bool:
+    return _flag_from_env("JARVIS_RUN_COORDINATOR_PASSTHROUGH")
+
+
+def _flag_from_env(name: str) -> bool:
+    return os.environ.get(name, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
 def run_coordinator_audience_from_env() -> str | None:
     value = os.environ.get("JARVIS_RUN_COORDINATOR_AUDIENCE")
     if value:
@@ -41,11 +74,21 @@ def auth_client_from_env() -> AuthClient:
         raise RuntimeError(f"Invalid ARP_AUTH_* token exchange config: {exc}") from exc
 
 
-def _has_auth_env() -> bool:
-    return any(key.startswith("ARP_AUTH_") for key in os.environ)
+_DEV_SECURE_AUTH_SETTINGS = AuthSettings(mode="required", issuer=DEFAULT_DEV_KEYCLOAK_ISSUER)
+
+
+def _auth_env() -> tuple[tuple[str, str], ...]:
+    return tuple(sorted((key, value) for key, value in os.environ.items() if key.startswith("ARP_AUTH_")))
+
+
+@functools.lru_cache(maxsize=8)
+def _auth_settings_for(auth_env: tuple[tuple[str, str], ...]) -> AuthSettings:
+    return AuthSettings.from_env(dict(auth_env))
 
 
 def auth_settings_from_env_or_dev_secure() -> AuthSettings:
-    if _has_auth_env():
-        return AuthSettings.from_env()
-    return AuthSettings(mode="required", issuer=DEFAULT_DEV_KEYCLOAK_ISSUER)
+    # Keyed on the ARP_AUTH_* snapshot so repeated create_app() calls reuse
+    # settings while env changes (tests, reloads) still take effect.
+    if auth_env := _auth_env():
+        return _auth_settings_for(auth_env)
+    return _DEV_SECURE_AUTH_SETTINGS
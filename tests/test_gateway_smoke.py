@@ -1,21 +1,29 @@
 import asyncio
+from types import SimpleNamespace
 from typing import cast
 from datetime import datetime, timezone
 
+import httpx
+import pytest
+from arp_auth import AuthClient
 from arp_standard_model import (
     Check,
     Health,
     NodeTypeRef,
     RunGatewayHealthRequest,
     RunGatewayStartRunRequest,
+    RunGatewayVersionRequest,
     RunStartRequest,
     RunState,
     Run,
     Status,
 )
-from arp_standard_server import ArpServerError
+from arp_standard_server import ArpServerError, AuthSettings
+from arp_standard_server.run_gateway import create_router
+from fastapi.testclient import TestClient
+import jarvis_run_gateway.gateway as gateway_mod
 from jarvis_run_gateway.gateway import RunGateway
-from jarvis_run_gateway.run_coordinator_client import RunCoordinatorGatewayClient
+from jarvis_run_gateway.run_coordinator_client import AsyncRunCoordinatorClient, RunCoordinatorGatewayClient
 
 
 class _FakeCoordinator:
@@ -93,7 +101,9 @@ def test_health_propagates_downstream_status() -> None:
 
     assert response.status == Status.degraded
     assert response.checks is not None
-    assert any(check.name == "run_coordinator" for check in response.checks)
+    assert [check.name for check in response.checks] == ["run_coordinator", "db"]
+    assert response.checks[0].details == {"url": "http://coordinator.test"}
+    assert response.model_dump(mode="json")["checks"][0]["status"] == "degraded"
 
 
 def test_health_degrades_on_exception() -> None:
@@ -109,3 +119,137 @@ def test_health_degrades_on_exception() -> None:
     assert response.status == Status.degraded
     assert response.checks is not None
     assert any(check.name == "run_coordinator" for check in response.checks)
+
+
+def test_version_route_serves_cached_payload(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    gateway = RunGateway(
+        run_coordinator=cast(RunCoordinatorGatewayClient, _FakeCoordinator()),
+        service_version="9.9.9",
+    )
+    app = gateway.create_app(title="test", auth_settings=AuthSettings(mode="disabled"))
+    assert asyncio.run(gateway.version(RunGatewayVersionRequest())).service_version == "9.9.9"
+
+    async def _boom(request):  # type: ignore[no-untyped-def]
+        raise AssertionError("HTTP path must not call version()")
+
+    monkeypatch.setattr(gateway, "version", _boom)
+    response = TestClient(app).get("/v1/version")
+    assert response.status_code == 200
+    assert response.content == gateway._version_bytes  # type: ignore[attr-defined]
+    assert response.json()["service_version"] == "9.9.9"
+
+    operation = app.openapi()["paths"]["/v1/version"]["get"]
+    assert operation["operationId"] == "version_v1_version_get"
+    assert operation["summary"] == "Version"
+
+
+def test_batch_get_runs_route() -> None:
+    class _Coordinator(_FakeCoordinator):
+        async def get_runs(self, run_ids, *, subject_token=None):  # type: ignore[no-untyped-def]
+            return [Run(run_id=run_id, state=RunState.running, root_node_run_id="node_run_test") for run_id in run_ids]
+
+    gateway = RunGateway(run_coordinator=cast(RunCoordinatorGatewayClient, _Coordinator()))
+    client = TestClient(gateway.create_app(title="test", auth_settings=AuthSettings(mode="disabled")))
+
+    response = client.post("/v1/runs:batchGet", json={"run_ids": ["run_1", "run_2"]})
+    assert response.status_code == 200
+    assert [run["run_id"] for run in response.json()] == ["run_1", "run_2"]
+
+    response = client.post("/v1/runs:batchGet", json={"run_ids": [f"run_{i}" for i in range(101)]})
+    assert response.status_code == 400
+    assert response.json()["error"]["code"] == "invalid_request"
+
+    operation = client.app.openapi()["paths"]["/v1/runs:batchGet"]["post"]  # type: ignore[attr-defined]
+    assert operation["operationId"] == "batch_get_runs_v1_runs_batchGet_post"
+    assert operation["summary"] == "Batch Get Runs"
+
+
+def test_stream_run_events_route_streams_ndjson() -> None:
+    class _Coordinator(_FakeCoordinator):
+        async def stream_run_event_chunks(self, run_id, *, subject_token=None):  # type: ignore[no-untyped-def]
+            async def _chunks():  # type: ignore[no-untyped-def]
+                yield b'{"seq":1}\n'
+                yield b'{"seq":2}\n'
+
+            return _chunks()
+
+    gateway = RunGateway(run_coordinator=cast(RunCoordinatorGatewayClient, _Coordinator()))
+    client = TestClient(gateway.create_app(title="test", auth_settings=AuthSettings(mode="disabled")))
+
+    response = client.get("/v1/runs/run_1/events")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert response.content == b'{"seq":1}\n{"seq":2}\n'
+
+    operation = client.app.openapi()["paths"]["/v1/runs/{run_id}/events"]["get"]  # type: ignore[attr-defined]
+    assert operation["operationId"] == "stream_run_events_v1_runs__run_id__events_get"
+    assert list(operation["responses"]["200"]["content"]) == ["application/x-ndjson"]
+
+
+def test_create_app_rejects_sync_routes(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    def _router_with_sync_route(server):  # type: ignore[no-untyped-def]
+        router = create_router(server)
+
+        def _sync_ping() -> dict[str, str]:
+            return {"status": "ok"}
+
+        router.add_api_route("/v1/ping", _sync_ping, methods=["GET"])
+        return router
+
+    monkeypatch.setattr(gateway_mod, "create_router", _router_with_sync_route)
+    gateway = RunGateway(run_coordinator=cast(RunCoordinatorGatewayClient, _FakeCoordinator()))
+
+    with pytest.raises(TypeError, match="/v1/ping"):
+        gateway.create_app(title="test", auth_settings=AuthSettings(mode="disabled"))
+
+
+def test_passthrough_routes_return_coordinator_bytes() -> None:
+    raw_run = b'{"run_id":"run_1","state":"running","root_node_run_id":"node_run_1"}'
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/v1/runs/missing":
+            return httpx.Response(404, json={"error": {"code": "run_not_found", "message": "nope"}})
+        return httpx.Response(200, content=raw_run)
+
+    class _Auth:
+        def client_credentials(self, *, audience=None, scope=None):  # type: ignore[no-untyped-def]
+            return SimpleNamespace(access_token="svc-token")
+
+    coordinator = RunCoordinatorGatewayClient(
+        base_url="http://coordinator.test",
+        auth_client=cast(AuthClient, _Auth()),
+        async_client=AsyncRunCoordinatorClient(
+            http_client=httpx.AsyncClient(base_url="http://coordinator.test", transport=httpx.MockTransport(_handler))
+        ),
+    )
+    gateway = RunGateway(run_coordinator=coordinator, passthrough_responses=True)
+    client = TestClient(gateway.create_app(title="test", auth_settings=AuthSettings(mode="disabled")))
+
+    assert client.get("/v1/runs/run_1").content == raw_run
+    assert client.post("/v1/runs/run_1:cancel").content == raw_run
+    body = {"root_node_type_ref": {"node_type_id": "composite.echo", "version": "0.1.0"}, "input": {}}
+    assert client.post("/v1/runs", json=body).content == raw_run
+
+    response = client.get("/v1/runs/missing")
+    assert response.status_code == 404
+    assert response.json()["error"]["code"] == "run_not_found"
+
+
+def test_passthrough_keeps_published_operations() -> None:
+    def _operations(passthrough: bool) -> dict[tuple[str, str], tuple[str, str]]:
+        gateway = RunGateway(
+            run_coordinator=cast(RunCoordinatorGatewayClient, _FakeCoordinator()),
+            passthrough_responses=passthrough,
+        )
+        spec = gateway.create_app(title="test", auth_settings=AuthSettings(mode="disabled")).openapi()
+        return {
+            (path, method): (operation["operationId"], operation["summary"])
+            for path, operations in spec["paths"].items()
+            for method, operation in operations.items()
+        }
+
+    operations = _operations(passthrough=True)
+    assert operations == _operations(passthrough=False)
+    assert operations[("/v1/runs", "post")] == ("start_run_v1_runs_post", "Start Run")
+    assert operations[("/v1/runs/{run_id}", "get")] == ("get_run_v1_runs__run_id__get", "Get Run")
+    assert operations[("/v1/runs/{run_id}:cancel", "post")] == ("cancel_run_v1_runs__run_id__cancel_post", "Cancel Run")
@@ -2,14 +2,15 @@ import asyncio
 from types import SimpleNamespace
 from typing import Any, cast
 
+import httpx
 import pytest
 
 from arp_auth import AuthClient
 from arp_standard_client.run_coordinator import RunCoordinatorClient
 from arp_standard_client.errors import ArpApiError
-from arp_standard_model import NodeTypeRef, RunStartRequest
+from arp_standard_model import NodeTypeRef, RunCoordinatorHealthRequest, RunStartRequest
 from arp_standard_server import ArpServerError
-from jarvis_run_gateway.run_coordinator_client import RunCoordinatorGatewayClient
+from jarvis_run_gateway.run_coordinator_client import AsyncRunCoordinatorClient, RunCoordinatorGatewayClient
 
 
 class _OkAuth:
@@ -30,6 +31,11 @@ class _BaseClient:
         self.raw_client = _RawClient()
 
 
+def _async_client(handler) -> AsyncRunCoordinatorClient:  # type: ignore[no-untyped-def]
+    http_client = httpx.AsyncClient(base_url="http://coordinator.test", transport=httpx.MockTransport(handler))
+    return AsyncRunCoordinatorClient(http_client=http_client)
+
+
 def _run_start_request() -> RunStartRequest:
     return RunStartRequest(
         root_node_type_ref=NodeTypeRef(node_type_id="composite.echo", version="0.1.0"),
@@ -127,3 +133,170 @@ def test_unexpected_error_maps_to_unavailable() -> None:
     assert exc.value.code == "run_coordinator_unavailable"
     assert exc.value.details is not None
     assert exc.value.details["run_coordinator_url"] == "http://coordinator.test"
+
+
+def test_async_client_get_run() -> None:
+    seen: list[httpx.Request] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"run_id": "run_1", "state": "running", "root_node_run_id": "node_run_1"})
+
+    client = RunCoordinatorGatewayClient(
+        base_url="http://coordinator.test",
+        auth_client=cast(AuthClient, _OkAuth()),
+        async_client=_async_client(_handler),
+    )
+
+    run = asyncio.run(client.get_run("run_1", subject_token="inbound"))
+    assert run.run_id == "run_1"
+    assert seen[0].url.path == "/v1/runs/run_1"
+    assert seen[0].headers["Authorization"] == "Bearer exchanged-token"
+
+
+def test_async_client_error_envelope_passthrough() -> None:
+    def _handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(404, json={"error": {"code": "run_not_found", "message": "nope", "details": {"x": "y"}}})
+
+    client = RunCoordinatorGatewayClient(
+        base_url="http://coordinator.test",
+        auth_client=cast(AuthClient, _OkAuth()),
+        async_client=_async_client(_handler),
+    )
+
+    with pytest.raises(ArpServerError) as exc:
+        asyncio.run(client.cancel_run("run_1"))
+    assert exc.value.code == "run_not_found"
+    assert exc.value.status_code == 404
+    assert exc.value.details == {"x": "y"}
+
+
+def test_async_client_unexpected_status() -> None:
+    def _handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(503, text="upstream down")
+
+    client = RunCoordinatorGatewayClient(
+        base_url="http://coordinator.test",
+        auth_client=cast(AuthClient, _OkAuth()),
+        async_client=_async_client(_handler),
+    )
+
+    with pytest.raises(ArpServerError) as exc:
+        asyncio.run(client.get_run("run_1"))
+    assert exc.value.code == "run_coordinator_error"
+    assert exc.value.status_code == 502
+    assert exc.value.details is not None
+    assert exc.value.details["status_code"] == 503
+
+
+def test_get_runs_batches_with_single_token() -> None:
+    exchanges: list[str] = []
+
+    class _CountingAuth(_OkAuth):
+        def exchange_token(self, *, subject_token, audience=None, scope=None):  # type: ignore[no-untyped-def]
+            exchanges.append(subject_token)
+            return SimpleNamespace(access_token="exchanged-token")
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        run_id = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(200, json={"run_id": run_id, "state": "running", "root_node_run_id": f"node_{run_id}"})
+
+    client = RunCoordinatorGatewayClient(
+        base_url="http://coordinator.test",
+        auth_client=cast(AuthClient, _CountingAuth()),
+        async_client=_async_client(_handler),
+    )
+
+    runs = asyncio.run(client.get_runs(["run_1", "run_2", "run_3"], subject_token="inbound"))
+    assert [run.run_id for run in runs] == ["run_1", "run_2", "run_3"]
+    assert exchanges == ["inbound"]
+
+
+def test_exchanged_tokens_are_cached_until_expiry() -> None:
+    exchanges: list[str] = []
+
+    class _ExpiringAuth(_OkAuth):
+        def exchange_token(self, *, subject_token, audience=None, scope=None):  # type: ignore[no-untyped-def]
+            exchanges.append(subject_token)
+            return SimpleNamespace(access_token=f"exchanged-{len(exchanges)}", expires_in=300)
+
+    client = RunCoordinatorGatewayClient(
+        base_url="http://coordinator.test",
+        auth_client=cast(AuthClient, _ExpiringAuth()),
+        async_client=_async_client(lambda request: httpx.Response(200)),
+    )
+
+    async def _tokens() -> list[str]:
+        return [
+            await client._resolve_bearer_token("inbound"),  # type: ignore[attr-defined]
+            await client._resolve_bearer_token("inbound"),  # type: ignore[attr-defined]
+            await client._resolve_bearer_token("other"),  # type: ignore[attr-defined]
+        ]
+
+    assert asyncio.run(_tokens()) == ["exchanged-1", "exchanged-1", "exchanged-2"]
+    assert exchanges == ["inbound", "other"]
+
+
+def test_stream_run_event_chunks() -> None:
+    def _handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/v1/runs/missing/events":
+            return httpx.Response(404, json={"error": {"code": "run_not_found", "message": "nope"}})
+        return httpx.Response(200, content=b'{"seq":1}\n{"seq":2}\n')
+
+    client = RunCoordinatorGatewayClient(
+        base_url="http://coordinator.test",
+        auth_client=cast(AuthClient, _OkAuth()),
+        async_client=_async_client(_handler),
+    )
+
+    async def _collect(run_id: str) -> bytes:
+        chunks = await client.stream_run_event_chunks(run_id)
+        return b"".join([chunk async for chunk in chunks])
+
+    assert asyncio.run(_collect("run_1")) == b'{"seq":1}\n{"seq":2}\n'
+    with pytest.raises(ArpServerError) as exc:
+        asyncio.run(_collect("missing"))
+    assert exc.value.code == "run_not_found"
+    assert exc.value.status_code == 404
+
+
+def test_async_factory_client_runs_on_event_loop() -> None:
+    class _AsyncFactoryClient:
+        async def get_run(self, request):  # type: ignore[no-untyped-def]
+            raise ArpApiError("run_not_found", "nope", status_code=404)
+
+    def _async_factory(raw_client: Any) -> RunCoordinatorClient:
+        _ = raw_client
+        return cast(RunCoordinatorClient, _AsyncFactoryClient())
+
+    client = RunCoordinatorGatewayClient(
+        base_url="http://coordinator.test",
+        client=cast(RunCoordinatorClient, _BaseClient()),
+        auth_client=cast(AuthClient, _OkAuth()),
+        client_factory=_async_factory,
+    )
+
+    with pytest.raises(ArpServerError) as exc:
+        asyncio.run(client.get_run("run_1"))
+    assert exc.value.code == "run_not_found"
+    assert exc.value.status_code == 404
+
+
+def test_shared_transport_survives_client_close() -> None:
+    class _Transport(httpx.MockTransport):
+        closed = False
+
+        async def aclose(self) -> None:
+            self.closed = True
+
+    transport = _Transport(lambda request: httpx.Response(200, json={"status": "ok", "time": "2026-01-01T00:00:00Z"}))
+
+    async def _run() -> None:
+        first = AsyncRunCoordinatorClient(base_url="http://a.test", transport=transport)
+        second = AsyncRunCoordinatorClient(base_url="http://b.test", transport=transport)
+        await first.aclose()
+        health = await second.health(RunCoordinatorHealthRequest())
+        assert health.status == "ok"
+
+    asyncio.run(_run())
+    assert transport.closed is False
@@ -1,6 +1,24 @@
+import os
+
 import pytest
 
-from jarvis_run_gateway.utils import auth_client_from_env, run_coordinator_audience_from_env
+import jarvis_run_gateway.utils as utils_mod
+
+from jarvis_run_gateway.utils import (
+    auth_client_from_env,
+    auth_settings_from_env_or_dev_secure,
+    coarse_now,
+    normalize_base_url,
+    run_coordinator_audience_from_env,
+    run_coordinator_sync_client_from_env,
+)
+
+
+def test_normalize_base_url() -> None:
+    assert normalize_base_url("http://coordinator.test") == "http://coordinator.test"
+    assert normalize_base_url("http://coordinator.test/") == "http://coordinator.test"
+    assert normalize_base_url("http://coordinator.test/v1") == "http://coordinator.test"
+    assert normalize_base_url("http://coordinator.test/v1//") == "http://coordinator.test"
 
 
 def test_run_coordinator_audience_default(monkeypatch) -> None:
@@ -13,6 +31,13 @@ def test_run_coordinator_audience_override(monkeypatch) -> None:
     assert run_coordinator_audience_from_env() == "custom-aud"
 
 
+def test_run_coordinator_sync_client_flag(monkeypatch) -> None:
+    monkeypatch.delenv("JARVIS_RUN_COORDINATOR_SYNC_CLIENT", raising=False)
+    assert run_coordinator_sync_client_from_env() is False
+    monkeypatch.setenv("JARVIS_RUN_COORDINATOR_SYNC_CLIENT", "1")
+    assert run_coordinator_sync_client_from_env() is True
+
+
 def test_auth_client_from_env_missing(monkeypatch) -> None:
     monkeypatch.delenv("ARP_AUTH_CLIENT_ID", raising=False)
     monkeypatch.delenv("ARP_AUTH_CLIENT_SECRET", raising=False)
@@ -31,3 +56,29 @@ def test_auth_client_from_env_valid(monkeypatch) -> None:
     client = auth_client_from_env()
     assert client is not None
     assert client._token_endpoint == "http://sts.test/token"
+
+
+def test_auth_settings_reused_until_env_changes(monkeypatch) -> None:
+    for key in [key for key in os.environ if key.startswith("ARP_AUTH_")]:
+        monkeypatch.delenv(key)
+    default = auth_settings_from_env_or_dev_secure()
+    assert default.mode == "required"
+    assert default is auth_settings_from_env_or_dev_secure()
+
+    monkeypatch.setenv("ARP_AUTH_PROFILE", "dev-insecure")
+    insecure = auth_settings_from_env_or_dev_secure()
+    assert insecure.mode == "disabled"
+    assert insecure is auth_settings_from_env_or_dev_secure()
+
+    monkeypatch.setenv("ARP_AUTH_MODE", "optional")
+    assert auth_settings_from_env_or_dev_secure().mode == "optional"
+
+
+def test_coarse_now_coalesces_within_resolution(monkeypatch) -> None:
+    ticks = iter([100.0, 100.0002, 100.002])
+    monkeypatch.setattr(utils_mod.time, "monotonic", lambda: next(ticks))
+    monkeypatch.setattr(utils_mod, "_coarse_now", None)
+
+    first = coarse_now()
+    assert coarse_now() is first
+    assert coarse_now() is not first